@@ -4,14 +4,47 @@ Most software engineers would rather use fixtures instead of a simple testing fi
 But I can't help it, I hate fixtures. It is harder to debug And I find it hard to explain to beginners.
 """
 
+import atexit
+import functools
+import importlib
+import os
 import shutil
+import sys
+import tempfile
 from pathlib import Path
+from types import ModuleType
+from typing import Callable
 
-from smolagents import Message, MessageRole
+from smolagents import LiteLLMModel, Message, MessageRole
 
 from aiengineer.common import AIENGINEER_SRC_DIR
 
-TESTING_PATH = AIENGINEER_SRC_DIR / "testing"
+# Temporary testing files go to the in-memory /dev/shm when the system has one.
+_SHM_PATH = Path("/dev/shm")
+TEMPORARY_PATH = _SHM_PATH if _SHM_PATH.is_dir() else Path(tempfile.gettempdir())
+
+# Under pytest-xdist (`pytest -n auto`), every worker gets its own importable `testing`
+# package so that parallel tests never clean or overwrite each other's folders.
+# The root is a fresh private directory, so concurrent sessions and other users never share it.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if XDIST_WORKER:
+    _WORKER_ROOT = Path(
+        tempfile.mkdtemp(prefix=f"aiengineer_testing_{XDIST_WORKER}_", dir=TEMPORARY_PATH)
+    )
+    # /dev/shm is kept in memory until reboot: never leave the testing folders behind
+    atexit.register(shutil.rmtree, _WORKER_ROOT, ignore_errors=True)
+    sys.path.insert(0, str(_WORKER_ROOT))
+    TESTING_PATH = _WORKER_ROOT / "testing"
+else:
+    TESTING_PATH = AIENGINEER_SRC_DIR / "testing"
+
+# Snapshots of the testing folders, see `_copy_template`
+_TEMPLATES_PATH: Path | None = None
+_BUILT_TEMPLATES: set[str] = set()
+
+# Recorded LLM answers, see `use_llm_cassettes`
+CASSETTES_PATH = AIENGINEER_SRC_DIR.parent / "tests" / "cassettes"
+
 # TESTING_MODEL = "mistral/mistral-medium-latest"
 TESTING_MODEL = "deepseek/deepseek-chat"
 
@@ -39,8 +72,9 @@ def clean_after_test(testing_path: Path = TESTING_PATH):
     (testing_path / "__init__.py").touch()
 
 
-def initialise_folder_with_non_working_code() -> Path:
-    testing_dir = TESTING_PATH / "llm_fix_repo"
+def initialise_folder_with_non_working_code(
+    testing_dir=TESTING_PATH / "llm_fix_repo",
+) -> Path:
     initialise_empty_folder(testing_dir)
 
     file = testing_dir / "conversion.py"
@@ -67,11 +101,40 @@ print(masse_kg)
     return testing_dir
 
 
-def initialise_folder_with_working_code(
-    testing_dir=TESTING_PATH / "test_working_code",
+def _get_templates_path() -> Path:
+    global _TEMPLATES_PATH
+    if _TEMPLATES_PATH is None:
+        _TEMPLATES_PATH = Path(
+            tempfile.mkdtemp(prefix="aiengineer_templates_", dir=TEMPORARY_PATH)
+        )
+        atexit.register(shutil.rmtree, _TEMPLATES_PATH, ignore_errors=True)
+    return _TEMPLATES_PATH
+
+
+def _copy_template(
+    template_name: str, testing_dir: Path, write_files: Callable[[Path], None]
 ) -> Path:
+    """
+    Reset `testing_dir` to the files created by `write_files`.
+
+    The files are written only once per process in a template folder, the following calls just copy it.
+    """
+    template_dir = _get_templates_path() / template_name
+    if template_name not in _BUILT_TEMPLATES:
+        shutil.rmtree(template_dir, ignore_errors=True)
+        template_dir.mkdir(parents=True)
+        write_files(template_dir)
+        _BUILT_TEMPLATES.add(template_name)
+
     initialise_empty_folder(testing_dir)
+    # shutil.copy instead of copy2: the copies get fresh modification times.
+    shutil.copytree(
+        template_dir, testing_dir, dirs_exist_ok=True, copy_function=shutil.copy
+    )
+    return testing_dir
+
 
+def _write_working_code(testing_dir: Path, module_name: str) -> None:
     file = testing_dir / "conversion.py"
     file.write_text(
         '''
@@ -87,7 +150,7 @@ def kg_to_pounds(kg_value):
 print("DEBUG: conversion.py loaded successfully")
 print(f"DEBUG: 1 kg = {kg_to_pounds(1)} pounds")
 print(f"DEBUG: masse_kg ({masse_kg} kg) = {kg_to_pounds(masse_kg)} pounds")'''.replace(
-            "{module_name}", testing_dir.name
+            "{module_name}", module_name
         )
     )
     file = testing_dir / "values.py"
@@ -99,11 +162,21 @@ masse_kg = 10
 print(masse_kg)
     '''
     )
-    return testing_dir
 
 
-def initialise_folder_with_docs() -> Path:
-    testing_dir = TESTING_PATH / "test_docs"
+def initialise_folder_with_working_code(
+    testing_dir=TESTING_PATH / "test_working_code",
+) -> Path:
+    return _copy_template(
+        template_name=f"working_code_{testing_dir.name}",
+        testing_dir=testing_dir,
+        write_files=functools.partial(
+            _write_working_code, module_name=testing_dir.name
+        ),
+    )
+
+
+def initialise_folder_with_docs(testing_dir=TESTING_PATH / "test_docs") -> Path:
     initialise_folder_with_working_code(testing_dir)
 
     doc_path = testing_dir / "docs.py"
@@ -112,7 +185,7 @@ def initialise_folder_with_docs() -> Path:
 """Main document for the engineering project."""  
 
 import pandas as pd
-from testing.test_docs.values import masse_kg
+from testing.{module_name}.values import masse_kg
 from pyforge.note import (Citation, DocumentConfig, Figure, Reference, Table,
                           Title, display)
 
@@ -138,11 +211,100 @@ The system mass is {masse_kg} kg.
 """, Table(df, "Sample data table")
 )
 
-'''
+'''.replace(
+            "{module_name}", testing_dir.name
+        )
     )
     return doc_path
 
 
+@functools.cache
+def _make_aider_requests_reproducible() -> None:
+    """
+    Send the same aider request for the same task, so that it hits its recording.
+    """
+    from aider.coders import Coder
+
+    # aider writes the date, the platform and $SHELL in its system prompt: the same request would get
+    # a new cache key every day and on every machine
+    Coder.get_platform_info = lambda self: "- Platform information unavailable\n"
+
+    # The files in the chat are a set, listed in a different order by each process
+    get_abs_fnames_content = Coder.get_abs_fnames_content
+    Coder.get_abs_fnames_content = lambda self: sorted(get_abs_fnames_content(self))
+
+
+def use_llm_cassettes(cassettes_path: Path = CASSETTES_PATH, record: bool = False) -> None:
+    """
+    Record the LLM answers in `cassettes_path` and replay them whenever the exact same request is sent again.
+
+    All the LLM calls go through LiteLLM (smolagents and aider), so its disk cache is used as the cassette.
+    The tools still run for real, so the files written by the agents are reproduced on replay.
+
+    With `record`, the stored answers are never read: every request sent by the selected tests calls the
+    API again and overwrites its recording, the answers of the other tests are kept.
+    """
+    import litellm
+    from litellm.caching.caching import Cache
+
+    _make_aider_requests_reproducible()
+    cache = Cache(type="disk", disk_cache_dir=str(cassettes_path))
+    if record:
+        cache.get_cache = lambda **kwargs: None
+
+        async def _no_cached_answer(**kwargs):
+            return None
+
+        cache.async_get_cache = _no_cached_answer
+    litellm.cache = cache
+
+
+_LLM_CASSETTES = os.environ.get("AIENGINEER_LLM_CASSETTES")
+if _LLM_CASSETTES:
+    use_llm_cassettes(record=_LLM_CASSETTES == "record")
+
+
+@functools.cache
+def get_testing_model() -> LiteLLMModel:
+    """
+    Return the LiteLLMModel shared by all the tests of the session.
+
+    Sharing the instance avoids rebuilding its client and lets the tests reuse the same connections.
+    Temperature 0 keeps the answers as reproducible as the provider allows, which also makes the
+    requests of a rerun identical and replayable from the cassettes.
+    """
+    return LiteLLMModel(TESTING_MODEL, temperature=0)
+
+
+def fresh_import(module_name: str) -> ModuleType:
+    """
+    Import `module_name` from the files currently on disk.
+
+    The testing folders are rewritten between tests, so the modules already imported from them
+    are dropped and the import caches are invalidated first.
+    """
+    testing_prefix = f"{TESTING_PATH.name}."
+    for name in [name for name in sys.modules if name.startswith(testing_prefix)]:
+        del sys.modules[name]
+    importlib.invalidate_caches()
+    return importlib.import_module(module_name)
+
+
+def import_abc_package(folder: str) -> ModuleType:
+    """
+    Import the a.py, b.py and c.py that the LLM was asked to write in `TESTING_PATH / folder`.
+
+    a and b must be modules of their own, and c must import them to compute `c = a + b = 3`.
+    """
+    package = f"{TESTING_PATH.name}.{folder}"
+    c_module = fresh_import(f"{package}.c")
+    importlib.import_module(f"{package}.a")
+    importlib.import_module(f"{package}.b")
+    assert hasattr(c_module, "a") and hasattr(c_module, "b")
+    assert c_module.c == 3
+    return c_module
+
+
 def get_tool_responses_from_messages(messages: list[Message]) -> list[Message]:
     return [
         message for message in messages if message["role"] == MessageRole.TOOL_RESPONSE
@@ -1,7 +1,14 @@
+import functools
 import logging
 from pathlib import Path
 
-from aiengineer.utils.parse_repository import FileAsObject, RepoAsJson, RepoAsObject
+from aiengineer.utils.parse_repository import (
+    FileAsObject,
+    RepoAsJson,
+    RepoAsObject,
+    is_recently_modified,
+    sorted_rglob,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,14 +56,43 @@ def get_print_outputs_in_repository(repo_path: Path) -> str:
 
 
 def get_repository_map(repo_path: Path, summary: bool = False) -> str:
+    signature = _get_repo_signature(repo_path=repo_path)
+    if signature is None:
+        return _build_repository_map(repo_path=repo_path, summary=summary)
+    return _get_repository_map(
+        repo_path=repo_path, summary=summary, signature=signature
+    )
+
+
+def _get_repo_signature(repo_path: Path) -> tuple[tuple[str, int, int], ...] | None:
+    """
+    Cheap fingerprint of the python files of a repo: any added, removed or edited file changes it.
+
+    Returns None if a file was modified too recently for its stat to prove it is unchanged.
+    """
+    signature = []
+    for file_path in sorted_rglob(repo_path):
+        stat = file_path.stat()
+        if is_recently_modified(stat):
+            return None
+        signature.append((file_path.as_posix(), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_repository_map(
+    repo_path: Path, summary: bool, signature: tuple[tuple[str, int, int], ...]
+) -> str:
+    return _build_repository_map(repo_path=repo_path, summary=summary)
+
+
+def _build_repository_map(repo_path: Path, summary: bool) -> str:
     repo = RepoAsObject.from_directory(repo_path=repo_path, with_summary=summary)
     repo_as_json = repo.to_repo_as_json(summary=summary)
     return repo_as_json.convert_to_flat_txt()
 
 
 def get_python_doc_as_markdown(doc_path: Path | str, repo_path: Path) -> str:
-    from pyforge.cli import markdown
-
     if isinstance(doc_path, Path):
         doc_path_str = FileAsObject.reduce_file_path(file_path=doc_path, repo_path=repo_path)
     else:
@@ -65,16 +101,38 @@ def get_python_doc_as_markdown(doc_path: Path | str, repo_path: Path) -> str:
         if not doc_path.is_absolute():
             doc_path = FileAsObject._reconstruct_file_path(file_str=doc_path, repo_path=repo_path)
 
-    repo_as_object = RepoAsObject.from_directory(repo_path=repo_path)
-    repo_as_json = repo_as_object.to_repo_as_json()
-    repo_as_dict = repo_as_json.to_dict()
-    if doc_path_str not in repo_as_dict:
+    repo_files = [
+        FileAsObject.reduce_file_path(file_path=file_path, repo_path=repo_path)
+        for file_path in sorted_rglob(repo_path)
+    ]
+    if doc_path_str not in repo_files:
         raise ValueError(
             f"""The document {doc_path_str} is not found in the repository {repo_path}.
 Here is the list of files in the repository:
-{"\n".join(list(repo_as_dict.keys()))}
+{"\n".join(repo_files)}
                          """
         )
+    doc_path = doc_path.resolve()
+    # The document runs and imports the other modules of the repo: the whole repo is part of the key
+    signature = _get_repo_signature(repo_path=repo_path)
+    if signature is None:
+        return _render_python_doc_as_markdown(doc_path=doc_path)
+    output_text = _get_python_doc_as_markdown(doc_path=doc_path, signature=signature)
+    # The markdown file is part of the result, write it again in case it was removed or edited
+    doc_path.with_suffix(".md").write_text(output_text)
+    return output_text
+
+
+@functools.lru_cache(maxsize=32)
+def _get_python_doc_as_markdown(
+    doc_path: Path, signature: tuple[tuple[str, int, int], ...]
+) -> str:
+    return _render_python_doc_as_markdown(doc_path=doc_path)
+
+
+def _render_python_doc_as_markdown(doc_path: Path) -> str:
+    from pyforge.cli import markdown
+
     output = doc_path.with_suffix(".md")
     markdown(doc_path=doc_path, output_path=output)
     output_text = output.read_text()
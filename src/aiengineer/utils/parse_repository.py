@@ -6,6 +6,7 @@ import io
 import json
 import os
 import sys
+import time
 import traceback
 from dataclasses import asdict, dataclass
 from pathlib import Path
@@ -16,6 +17,48 @@ from pydantic import BaseModel, Field
 def sorted_rglob(input: Path, pattern: str = "*.py") -> list[Path]:
     return sorted(input.rglob(pattern), key=lambda p: str(p))
 
+
+# Files modified less than this ago can still be rewritten within the same filesystem clock tick
+_RECENT_MTIME_NS = 1_000_000_000
+
+
+def is_recently_modified(stat: os.stat_result) -> bool:
+    """
+    Whether a stat is too recent to prove the file is unchanged: on filesystems with coarse timestamps,
+    a rewrite of the same size in the same clock tick keeps the same mtime (git's "racy clean" problem).
+    """
+    return time.time_ns() - stat.st_mtime_ns < _RECENT_MTIME_NS
+
+
+# file path -> ((st_ino, st_mtime_ns, st_size), content, summary or None if not computed yet)
+_FILES_CACHE: dict[Path, tuple[tuple[int, int, int], str, str | None]] = {}
+
+
+def _read_python_file(file_path: Path, with_summary: bool = False) -> tuple[str, str]:
+    """
+    Return the content and the summary of a file, only reading and parsing it again if it changed on disk.
+    """
+    stat = file_path.stat()
+    key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    trusted = not is_recently_modified(stat)
+    cached = _FILES_CACHE.get(file_path)
+    if cached is None or cached[0] != key or not trusted:
+        with open(file_path, encoding="utf-8") as f:
+            cached = (key, f.read(), None)
+    key, content, summary = cached
+    if with_summary and summary is None:
+        summary = _create_summary_python_file(
+            file_path=file_path,
+            include_header=True,
+            source=content,
+        )
+    if trusted:
+        _FILES_CACHE[file_path] = (key, content, summary)
+    else:
+        _FILES_CACHE.pop(file_path, None)
+    return content, summary if with_summary else ""
+
+
 class FileAsJson(BaseModel):
     """
     This is the representation of a file in the class, it contains both the name of the file and its content
@@ -57,11 +100,11 @@ class RepoAsJson(BaseModel):
         return output
 
     def convert_to_flat_txt(self) -> str:
-        message = ""
+        parts = []
         for file in self.files:
-            message += f"\n\n**{file.name}**: \n"
-            message += file.content
-        return message
+            parts.append(f"\n\n**{file.name}**: \n")
+            parts.append(file.content)
+        return "".join(parts)
 
 
 class FileAsObject(BaseModel):
@@ -184,18 +227,16 @@ class RepoAsObject(BaseModel):
         cls, repo_path: Path, with_summary: bool = False
     ) -> RepoAsObject:
         repo_files = []
-        for file_path in sorted_rglob(repo_path):
+        scanned_paths = sorted_rglob(repo_path)
+        # Only keep the files of the latest scan so the cache does not grow with every repo ever read
+        for cached_path in _FILES_CACHE.keys() - set(scanned_paths):
+            _FILES_CACHE.pop(cached_path, None)
+        for file_path in scanned_paths:
             if not file_path.exists():
                 raise FileNotFoundError(str(file_path))
-            else:
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
-            summary = ""
-            if with_summary:
-                summary = _create_summary_python_file(
-                    file_path=file_path,
-                    include_header=True,
-                )
+            content, summary = _read_python_file(
+                file_path=file_path, with_summary=with_summary
+            )
 
             repo_files.append(
                 FileAsObject.from_path(
@@ -274,11 +315,16 @@ class RepoAsObject(BaseModel):
 
 
 def _create_summary_python_file(
-    file_path: Path, include_header: bool = True, include_docstring: bool = True
+    file_path: Path,
+    include_header: bool = True,
+    include_docstring: bool = True,
+    source: str | None = None,
 ):
-    with open(file_path, "r", encoding="utf-8") as f:
-        source = f.read()
+    if source is None:
+        with open(file_path, "r", encoding="utf-8") as f:
+            source = f.read()
     tree = ast.parse(source)
+    lines = source.split("\n")
     # Extract components
     header = ast.get_docstring(tree) if include_header else ""
     functions = []
@@ -290,17 +336,17 @@ def _create_summary_python_file(
         if isinstance(node, ast.FunctionDef):
             functions.append(
                 _get_signature_with_docstring(
-                    node, source, include_docstring=include_docstring
+                    node, lines, include_docstring=include_docstring
                 )
             )
         elif isinstance(node, ast.ClassDef):
             classes.append(
                 _get_signature_with_docstring(
-                    node, source, include_docstring=include_docstring
+                    node, lines, include_docstring=include_docstring
                 )
             )
         elif isinstance(node, ast.Assign):
-            variables.append(_get_signature(node, source))
+            variables.append(_get_signature(node, lines))
 
     # Build summary
     summary = []
@@ -315,9 +361,8 @@ def _create_summary_python_file(
     return "\n".join(summary).strip()
 
 
-def _get_signature(node: ast.AST, source: str) -> str:
-    """Helper to extract signatures from source code"""
-    lines = source.split("\n")
+def _get_signature(node: ast.AST, lines: list[str]) -> str:
+    """Helper to extract signatures from the source code lines"""
     start_line = node.lineno - 1  # Convert to 0-based index
 
     if isinstance(node, ast.Assign):
@@ -336,12 +381,12 @@ def _get_signature(node: ast.AST, source: str) -> str:
 
 
 def _get_signature_with_docstring(
-    node: ast.AST, source: str, include_docstring: bool = True
+    node: ast.AST, lines: list[str], include_docstring: bool = True
 ) -> str:
     """
-    Helper to extract signatures along with their docstrings from source code.
+    Helper to extract signatures along with their docstrings from the source code lines.
     """
-    signature = _get_signature(node, source)
+    signature = _get_signature(node, lines)
     docstring = ast.get_docstring(node)
     if docstring and include_docstring:
         signature += f'\n"""\n{docstring}\n"""'
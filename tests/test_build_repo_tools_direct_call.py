@@ -18,7 +18,7 @@ from pathlib import Path
 from typing import List
 
 import pytest
-from smolagents import CodeAgent, LiteLLMModel, Message, MessageRole
+from smolagents import CodeAgent, Message, MessageRole
 
 from aiengineer.testing import (
     TESTING_MODEL,
@@ -28,11 +28,15 @@ from aiengineer.testing import (
     initialise_folder_with_working_code,
     initialise_folder_with_docs,
     initialise_empty_folder,
-    get_tool_responses_from_messages
+    get_tool_responses_from_messages,
+    get_testing_model,
+    fresh_import,
+    import_abc_package,
 )
 
 from aiengineer.smolagents_utils.build_repo_tools import build_repo_tools, RepoTool
 
+@pytest.mark.llm
 def test_llm_edit_repo_tool():
     testing_dir = TESTING_PATH / "llm_edit_repo"
     initialise_empty_folder(testing_dir)
@@ -48,7 +52,7 @@ Create three files in a directory called llm_edit_repo:
 '''
     
     tools = build_repo_tools(TESTING_PATH, litellm_id=TESTING_MODEL, original_task=original_task)
-    model = LiteLLMModel(TESTING_MODEL)
+    model = get_testing_model()
     
     agent = CodeAgent(
         tools=[tools[RepoTool.EDIT_FILE_WHOLE.value]],
@@ -60,13 +64,11 @@ Create three files in a directory called llm_edit_repo:
     )
 
 
-    from testing.llm_edit_repo import a, b, c
-    from testing.llm_edit_repo.c import a, b, c
-
-    assert c == 3
+    import_abc_package("llm_edit_repo")
     clean_after_test()
     
 
+@pytest.mark.llm
 def test_edit_file_whole_diff():
     testing_dir = TESTING_PATH / "llm_edit_repo"
     initialise_empty_folder(testing_dir)
@@ -82,7 +84,7 @@ Create three files in a directory called llm_edit_repo using edit_file_diff_tool
 '''
     
     tools = build_repo_tools(TESTING_PATH, litellm_id=TESTING_MODEL, original_task=original_task)
-    model = LiteLLMModel(TESTING_MODEL)
+    model = get_testing_model()
     
     agent = CodeAgent(
         tools=[tools[RepoTool.EDIT_FILE_DIFF.value]],
@@ -94,75 +96,51 @@ Create three files in a directory called llm_edit_repo using edit_file_diff_tool
     )
 
 
-    from testing.llm_edit_repo import a, b, c
-    from testing.llm_edit_repo.c import a, b, c
-
-    assert c == 3
+    import_abc_package("llm_edit_repo")
     clean_after_test()
         
-def test_call_llm_on_repo_with_files():
-    
-    # Here it should give the repository map and ask for modifications using this tool
-    testing_dir = TESTING_PATH / "test_folder"
-    initialise_folder_with_working_code(testing_dir)
-    original_task = """
-I want you to add a variable called twenty_kg_in_pounds in a new file called result.py next to the conversion.py file that will take as value the result of the conversion of 20 kg to pounds.
-
-edit_file_whole_tool is the only way for you to modify the repository.
-"""
-    tools = build_repo_tools(TESTING_PATH, litellm_id=TESTING_MODEL, original_task=original_task)
-    model = LiteLLMModel(TESTING_MODEL)
-    
-    agent = CodeAgent(
-        tools=[tools[RepoTool.EDIT_FILE_WHOLE.value], tools[RepoTool.GET_REPOSITORY_MAP.value], tools[RepoTool.EXEC_ALL_PYTHON_FILES.value]],
-        model=model,
-        max_steps=10,
-    )
-    agent.run(
-        original_task
-    )
-
-
-    from testing.test_folder.result import twenty_kg_in_pounds
-
-    assert abs(twenty_kg_in_pounds - 44.0924524) < 1
-    clean_after_test()
-
-def test_call_llm_on_repo_with_files_diff():
+@pytest.mark.llm
+@pytest.mark.parametrize(
+    "edit_tool",
+    [RepoTool.EDIT_FILE_WHOLE, RepoTool.EDIT_FILE_DIFF],
+    ids=lambda edit_tool: edit_tool.value,
+)
+def test_call_llm_on_repo_with_files(edit_tool: RepoTool):
     
     # Here it should give the repository map and ask for modifications using this tool
     testing_dir = TESTING_PATH / "test_folder"
     initialise_folder_with_working_code(testing_dir)
-    original_task = """
+    original_task = f"""
 I want you to add a variable called twenty_kg_in_pounds in a new file called result.py next to the conversion.py file that will take as value the result of the conversion of 20 kg to pounds.
 
-edit_file_diff_tool is the only way for you to modify the repository.
+{edit_tool.value} is the only way for you to modify the repository.
 """
     tools = build_repo_tools(TESTING_PATH, litellm_id=TESTING_MODEL, original_task=original_task)
-    model = LiteLLMModel(TESTING_MODEL)
+    model = get_testing_model()
     
     agent = CodeAgent(
-        tools=[tools[RepoTool.EDIT_FILE_DIFF.value], tools[RepoTool.GET_REPOSITORY_MAP.value], tools[RepoTool.EXEC_ALL_PYTHON_FILES.value]],
+        tools=[tools[edit_tool.value], tools[RepoTool.GET_REPOSITORY_MAP.value], tools[RepoTool.EXEC_ALL_PYTHON_FILES.value]],
         model=model,
-        max_steps=10,
+        max_steps=6,
     )
     agent.run(
         original_task
     )
 
 
-    from testing.test_folder.result import twenty_kg_in_pounds
+    twenty_kg_in_pounds = fresh_import("testing.test_folder.result").twenty_kg_in_pounds
 
     assert abs(twenty_kg_in_pounds - 44.0924524) < 1
     clean_after_test()
 
+@pytest.mark.llm
 def test_exec_file_tool():
     testing_dir = TESTING_PATH / "test_folder"
     initialise_folder_with_working_code(testing_dir)
     original_task = "Test executing a file and give me the output"
     
     tools = build_repo_tools(TESTING_PATH, litellm_id=TESTING_MODEL, original_task=original_task)
-    model = LiteLLMModel(TESTING_MODEL)
+    model = get_testing_model()
     
     agent = CodeAgent(
         tools=[tools[RepoTool.EXEC_FILE.value]],
@@ -179,13 +157,14 @@ def test_exec_file_tool():
     assert "DEBUG: masse_kg (10 kg) = 22.0462 pounds" in result
     clean_after_test()
     
+@pytest.mark.llm
 def test_delete_file_tool():
     testing_dir = TESTING_PATH / "test_folder"
     initialise_folder_with_working_code(testing_dir)
     original_task = "Delete conversion.py"
     
     tools = build_repo_tools(TESTING_PATH, litellm_id=TESTING_MODEL, original_task=original_task)
-    model = LiteLLMModel(TESTING_MODEL)
+    model = get_testing_model()
     
     agent = CodeAgent(
         tools=[tools[RepoTool.DELETE_FILE.value]],
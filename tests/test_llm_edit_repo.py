@@ -1,10 +1,13 @@
+import os
+
 import pytest
 
 from aiengineer.testing import (TESTING_MODEL, TESTING_PATH, clean_after_test,
                                 initialise_empty_folder,
                                 initialise_folder_with_docs,
                                 initialise_folder_with_non_working_code,
-                                initialise_folder_with_working_code)
+                                initialise_folder_with_working_code,
+                                fresh_import)
 
 from aiengineer.utils.llm_edit_repo import (
                                                get_print_outputs_in_repository,
@@ -13,6 +16,7 @@ from aiengineer.utils.llm_edit_repo import (
                                                get_repo_as_json_output,
                                                get_repository_map,
                                                exec_file_in_repo)
+from aiengineer.utils.parse_repository import RepoAsObject
 
 
 @pytest.mark.no_api
@@ -182,6 +186,31 @@ Sample data table
     clean_after_test()
 
 
+@pytest.mark.no_api
+def test_get_python_doc_as_markdown_after_editing_values():
+    doc_path = initialise_folder_with_docs()
+    values_path = doc_path.parent / "values.py"
+    markdown_path = doc_path.with_suffix(".md")
+    # Old enough files: the rendering is cached
+    old_mtime_ns = values_path.stat().st_mtime_ns - 10**10
+    for file_path in TESTING_PATH.rglob("*.py"):
+        os.utime(file_path, ns=(old_mtime_ns, old_mtime_ns))
+
+    markdown = get_python_doc_as_markdown(doc_path=doc_path, repo_path=TESTING_PATH)
+    assert "The system mass is 10 kg." in markdown
+    markdown_path.unlink()
+    assert get_python_doc_as_markdown(doc_path=doc_path, repo_path=TESTING_PATH) == markdown
+    assert markdown_path.read_text() == markdown
+
+    values_path.write_text(values_path.read_text().replace("masse_kg = 10", "masse_kg = 99"))
+    # docs.py may be run in this process, where the old values module is already imported
+    fresh_import("testing.test_docs.values")
+    markdown = get_python_doc_as_markdown(doc_path=doc_path, repo_path=TESTING_PATH)
+    assert "The system mass is 99 kg." in markdown
+    assert markdown_path.read_text() == markdown
+    clean_after_test()
+
+
 def test_exec_file_in_repo():
     initialise_folder_with_working_code()
     output = exec_file_in_repo(file_path="testing/test_working_code/conversion.py", repo_path=TESTING_PATH)
@@ -196,3 +225,52 @@ def test_exec_file_in_repo_with_error():
     assert "No module named 'llm_fix_repo'" in output
     clean_after_test()
     
+
+
+def _get_values_content() -> str:
+    repo = RepoAsObject.from_directory(repo_path=TESTING_PATH)
+    return {file.file_path_str: file.file_content for file in repo.files}[
+        "testing/llm_fix_repo/values.py"
+    ]
+
+
+@pytest.mark.no_api
+def test_from_directory_rescans_rewritten_file():
+    testing_dir = initialise_folder_with_non_working_code()
+    values_path = testing_dir / "values.py"
+
+    # Same size, same inode and same mtime, as a rewrite within one tick of a coarse clock
+    mtime_ns = values_path.stat().st_mtime_ns
+    assert "masse_kg = 10" in _get_values_content()
+    values_path.write_text(values_path.read_text().replace("10", "20"))
+    os.utime(values_path, ns=(mtime_ns, mtime_ns))
+    assert "masse_kg = 20" in _get_values_content()
+
+    # An old file is served from the cache until it is rewritten
+    os.utime(values_path, ns=(mtime_ns - 10**10, mtime_ns - 10**10))
+    assert "masse_kg = 20" in _get_values_content()
+    values_path.write_text(values_path.read_text().replace("20", "30"))
+    assert "masse_kg = 30" in _get_values_content()
+    clean_after_test()
+
+
+@pytest.mark.no_api
+def test_get_repository_map_after_same_size_edit():
+    testing_dir = initialise_folder_with_non_working_code()
+    values_path = testing_dir / "values.py"
+    mtime_ns = values_path.stat().st_mtime_ns
+    assert "masse_kg = 10" in get_repository_map(repo_path=TESTING_PATH)
+
+    # Same size and same mtime, as a rewrite within one tick of a coarse clock
+    values_path.write_text(values_path.read_text().replace("10", "20"))
+    os.utime(values_path, ns=(mtime_ns, mtime_ns))
+    repository_map = get_repository_map(repo_path=TESTING_PATH)
+    assert "masse_kg = 20" in repository_map
+    assert "masse_kg = 10" not in repository_map
+
+    # Once the file is old enough, the map is cached until the next edit
+    os.utime(values_path, ns=(mtime_ns - 10**10, mtime_ns - 10**10))
+    assert "masse_kg = 20" in get_repository_map(repo_path=TESTING_PATH)
+    values_path.write_text(values_path.read_text().replace("20", "30"))
+    assert "masse_kg = 30" in get_repository_map(repo_path=TESTING_PATH)
+    clean_after_test()
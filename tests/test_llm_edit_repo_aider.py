@@ -4,7 +4,9 @@ from aiengineer.testing import (TESTING_MODEL, TESTING_PATH, clean_after_test,
                                 initialise_empty_folder,
                                 initialise_folder_with_docs,
                                 initialise_folder_with_non_working_code,
-                                initialise_folder_with_working_code)
+                                initialise_folder_with_working_code,
+                                fresh_import,
+                                import_abc_package)
 
 from aiengineer.aider_utils.llm_edit_repo import (
     llm_edit_repo,
@@ -12,7 +14,9 @@ from aiengineer.aider_utils.llm_edit_repo import (
     llm_edit_folder,
     llm_fix_repo,
 )
+from aiengineer.utils.llm_edit_repo import get_repo_as_json_output
 
+@pytest.mark.llm
 @pytest.mark.aider
 def test_call_llm_on_repo():
     testing_dir = TESTING_PATH / "llm_edit_repo"
@@ -32,12 +36,10 @@ Create three files in a directory called llm_edit_repo:
         repo_path=TESTING_PATH,
         litellm_id=TESTING_MODEL,
     )
-    from testing.llm_edit_repo import a, b, c
-    from testing.llm_edit_repo.c import a, b, c
-
-    assert c == 3
+    import_abc_package("llm_edit_repo")
     clean_after_test()
     
+@pytest.mark.llm
 @pytest.mark.aider
 def test_call_llm_on_repo_with_files():
     testing_dir = TESTING_PATH / "llm_edit_files"
@@ -59,13 +61,11 @@ Create three files in a directory named llm_edit_files:
         repo_path=TESTING_PATH,
         litellm_id=TESTING_MODEL,
     )
-    from testing.llm_edit_files import a, b, c
-    from testing.llm_edit_files.c import a, b, c
-
-    assert c == 3
+    import_abc_package("llm_edit_files")
     clean_after_test()
     
 
+@pytest.mark.llm
 @pytest.mark.aider
 def test_llm_edit_folder():
     testing_dir = TESTING_PATH / "llm_edit_folder"
@@ -86,23 +86,22 @@ Create three files in a directory named llm_edit_folder:
         repo_path=TESTING_PATH,
         litellm_id=TESTING_MODEL,
     )
-    from testing.llm_edit_folder import a, b, c
-    from testing.llm_edit_folder.c import a, b, c
-
-    assert c == 3
+    import_abc_package("llm_edit_folder")
     clean_after_test()
     
+@pytest.mark.llm
 @pytest.mark.aider
 def test_llm_fix_repo():
     initialise_folder_with_non_working_code()
-    problems = llm_fix_repo(
+    llm_fix_repo(
         repo_path=TESTING_PATH, litellm_id=TESTING_MODEL, edit_format="diff"
     )
-    problems = llm_fix_repo(
-        repo_path=TESTING_PATH, litellm_id=TESTING_MODEL, edit_format="diff"
+    # Checking the errors directly is enough, a second fix would cost another LLM call
+    problems = get_repo_as_json_output(
+        repo_path=TESTING_PATH, with_errors=True, with_outputs=False
     )
     assert problems is None
-    from testing.llm_fix_repo.conversion import masse_g
+    masse_g = fresh_import("testing.llm_fix_repo.conversion").masse_g
 
     assert masse_g == 10000
     clean_after_test()